@@ -1,19 +1,21 @@
-from flask import Flask, render_template, request, jsonify, redirect, url_for, flash, session
+from flask import Flask, Blueprint, render_template, request, jsonify, redirect, url_for, flash, session
 import sqlite3
 import csv
+import hmac
 import io
 import json
+import re
+import threading
+import time
 from datetime import datetime
+from functools import wraps
+from werkzeug.security import generate_password_hash, check_password_hash
 from werkzeug.utils import secure_filename
 import os
-import pandas as pd
 
-app = Flask(__name__)
-app.secret_key = 'your-secret-key-here'
-app.config['UPLOAD_FOLDER'] = 'uploads'
-
-# Ensure upload folder exists
-os.makedirs(app.config['UPLOAD_FOLDER'], exist_ok=True)
+# Routes live on a blueprint so importing this module stays cheap; the
+# Flask app itself is built by create_app() when a worker starts.
+bp = Blueprint('main', __name__)
 
 # Platform configurations
 PLATFORMS = {
@@ -67,6 +69,97 @@ CONDITION_MAPPING = {
     }
 }
 
+_db_initialized = False
+_db_init_lock = threading.Lock()
+
+def ensure_db():
+    """Run init_db once per process; later calls are no-ops"""
+    global _db_initialized
+    with _db_init_lock:
+        if not _db_initialized:
+            init_db()
+            _db_initialized = True
+
+def create_app(config=None):
+    """Build the Flask application.
+
+    Heavy optional dependencies (pandas) are not imported here; they are
+    loaded on first use so each worker boots with only Flask in memory.
+    The idempotent schema/migration step in init_db runs once per process.
+    """
+    app = Flask(__name__)
+    app.secret_key = 'your-secret-key-here'
+    app.config['UPLOAD_FOLDER'] = 'uploads'
+    if config:
+        app.config.update(config)
+    
+    # Ensure upload folder exists
+    os.makedirs(app.config['UPLOAD_FOLDER'], exist_ok=True)
+    
+    ensure_db()
+    
+    app.register_blueprint(bp)
+    return app
+
+def load_pandas():
+    """Import pandas on first use, or return None if it is not installed"""
+    try:
+        import pandas as pd
+    except ImportError:
+        return None
+    return pd
+
+def clean_csv_cell(value):
+    """Return a CSV cell as a string, or None if it is blank or missing"""
+    if isinstance(value, str) and value.strip():
+        return value
+    return None
+
+def read_csv_rows(csv_string):
+    """Parse CSV text into (columns, rows).
+
+    rows is a list of (row_num, row_dict) with every cell kept as the string
+    from the file, blank or missing cells as None, cells beyond the header
+    ignored and completely empty rows (including blank lines) dropped.
+    row_num counts records from the header, blank lines included. pandas is
+    used when it is installed, otherwise the standard csv module.
+    """
+    pd = load_pandas()
+    
+    if pd is not None:
+        # Read every cell as text so numeric columns are not turned into
+        # floats, never use a data column as the index, and keep blank lines
+        # so row numbers match the csv module path
+        df = pd.read_csv(io.StringIO(csv_string), dtype=str, keep_default_na=False,
+                         index_col=False, skip_blank_lines=False)
+        
+        # Clean column names - remove whitespace
+        df.columns = df.columns.str.strip()
+        
+        columns = df.columns.tolist()
+        rows = []
+        for index, row in df.iterrows():
+            row = {col: clean_csv_cell(value) for col, value in row.items()}
+            if any(value is not None for value in row.values()):
+                rows.append((index + 2, row))  # +2 because pandas is 0-indexed and we skip header
+        return columns, rows
+    
+    reader = csv.reader(io.StringIO(csv_string))
+    header = next(reader, None)
+    if header is None:
+        raise ValueError('No columns to parse from file')
+    columns = [col.strip() for col in header]
+    
+    rows = []
+    for row_num, values in enumerate(reader, start=2):
+        row = {col: clean_csv_cell(value) for col, value in zip(columns, values)}
+        if any(value is not None for value in row.values()):
+            rows.append((row_num, row))
+    return columns, rows
+
+# Stored in PRAGMA user_version; bump when init_db gains a one-off data migration
+SCHEMA_VERSION = 2
+
 def init_db():
     """Initialize the database with required tables"""
     conn = sqlite3.connect('phones.db')
@@ -113,12 +206,60 @@ def init_db():
         )
     ''')
     
-    # Insert default admin user
+    # Normalized tag and specification tables for indexed filtering
+    c.execute('''
+        CREATE TABLE IF NOT EXISTS phone_tags (
+            phone_id INTEGER NOT NULL,
+            tag TEXT NOT NULL,
+            PRIMARY KEY (phone_id, tag),
+            FOREIGN KEY (phone_id) REFERENCES phones (id)
+        )
+    ''')
+    
     c.execute('''
-        INSERT OR IGNORE INTO users (username, password, role) 
-        VALUES ('admin', 'password123', 'admin')
+        CREATE TABLE IF NOT EXISTS phone_specs (
+            phone_id INTEGER NOT NULL,
+            spec_key TEXT NOT NULL,
+            spec_value TEXT NOT NULL DEFAULT '',
+            PRIMARY KEY (phone_id, spec_key, spec_value),
+            FOREIGN KEY (phone_id) REFERENCES phones (id)
+        )
     ''')
     
+    c.execute('CREATE INDEX IF NOT EXISTS idx_phone_tags_tag ON phone_tags (tag, phone_id)')
+    c.execute('CREATE INDEX IF NOT EXISTS idx_phone_specs_kv ON phone_specs (spec_key, spec_value, phone_id)')
+    c.execute('CREATE INDEX IF NOT EXISTS idx_phones_brand ON phones (brand)')
+    c.execute('CREATE INDEX IF NOT EXISTS idx_phones_condition ON phones (condition)')
+    c.execute('CREATE INDEX IF NOT EXISTS idx_phones_storage ON phones (storage)')
+    
+    c.execute('PRAGMA user_version')
+    schema_version = c.fetchone()[0]
+    
+    # Backfill normalized rows for phones created before these tables existed
+    if schema_version < 1:
+        c.execute('SELECT id, tags, specifications FROM phones')
+        for phone_id, tags, specifications in c.fetchall():
+            sync_phone_attributes(c, phone_id, tags, specifications)
+    
+    # Hash any passwords still stored in plaintext
+    if schema_version < 2:
+        c.execute('SELECT id, password FROM users')
+        for user_id, password in c.fetchall():
+            if not is_password_hash(password):
+                c.execute('UPDATE users SET password = ? WHERE id = ?',
+                          (generate_password_hash(password), user_id))
+    
+    if schema_version < SCHEMA_VERSION:
+        c.execute(f'PRAGMA user_version = {SCHEMA_VERSION}')
+    
+    # Insert default admin user; hashing is slow, so only when it is missing
+    c.execute("SELECT 1 FROM users WHERE username = 'admin'")
+    if c.fetchone() is None:
+        c.execute('''
+            INSERT INTO users (username, password, role) 
+            VALUES ('admin', ?, 'admin')
+        ''', (generate_password_hash('password123'),))
+    
     conn.commit()
     conn.close()
 
@@ -142,13 +283,168 @@ def is_profitable(base_price, platform, min_profit_margin=0.1):
     profit_margin = profit / base_price if base_price > 0 else 0
     return profit_margin >= min_profit_margin
 
-@app.route('/')
+def parse_tags(tags):
+    """Split a free-text tag string into normalized, de-duplicated tags"""
+    if not tags:
+        return []
+    
+    result = []
+    for tag in re.split(r'[,;\n]', str(tags)):
+        tag = tag.strip().lower()
+        if tag and tag not in result:
+            result.append(tag)
+    return result
+
+def parse_specifications(specifications):
+    """Split free-text specifications into normalized (key, value) pairs.
+
+    Entries are separated by commas, semicolons or newlines. "RAM: 8GB" and
+    "RAM=8GB" become ('ram', '8gb'); a bare entry such as "5G" becomes ('5g', '').
+    """
+    if not specifications:
+        return []
+    
+    result = []
+    for entry in re.split(r'[,;\n]', str(specifications)):
+        entry = entry.strip()
+        if not entry:
+            continue
+        
+        parts = re.split(r'[:=]', entry, maxsplit=1)
+        key = parts[0].strip().lower()
+        value = parts[1].strip().lower() if len(parts) > 1 else ''
+        if key and (key, value) not in result:
+            result.append((key, value))
+    return result
+
+def sync_phone_attributes(c, phone_id, tags, specifications):
+    """Rebuild the normalized tag and spec rows for a phone"""
+    c.execute('DELETE FROM phone_tags WHERE phone_id = ?', (phone_id,))
+    c.execute('DELETE FROM phone_specs WHERE phone_id = ?', (phone_id,))
+
+    c.executemany('INSERT INTO phone_tags (phone_id, tag) VALUES (?, ?)',
+                  [(phone_id, tag) for tag in parse_tags(tags)])
+    c.executemany('INSERT INTO phone_specs (phone_id, spec_key, spec_value) VALUES (?, ?, ?)',
+                  [(phone_id, key, value) for key, value in parse_specifications(specifications)])
+
+def build_phone_filters(args, exclude=None):
+    """Build the WHERE clause shared by the phone list and facet endpoints.
+
+    Tag and spec filters are subqueries on the indexed phone_tags and
+    phone_specs tables instead of LIKE scans over the free-text columns.
+    Repeated tag/spec parameters must all match. A spec filter is parsed like
+    the specifications column, so "ram:8gb,5g" requires every entry; an entry
+    is either "key" (any value) or "key:value". The parameter named by
+    exclude is ignored, which the facet endpoint uses to count a dimension
+    without its own filter.
+    """
+    clauses = []
+    params = []
+
+    search = args.get('search', '')
+    if search:
+        clauses.append('(p.model_name LIKE ? OR p.brand LIKE ?)')
+        params.extend([f'%{search}%', f'%{search}%'])
+
+    for column in ('brand', 'condition', 'storage'):
+        value = args.get(column, '') if column != exclude else ''
+        if value:
+            clauses.append(f'p.{column} = ?')
+            params.append(value)
+
+    for tag in args.getlist('tag') if exclude != 'tag' else []:
+        tag = tag.strip().lower()
+        if tag:
+            clauses.append('p.id IN (SELECT phone_id FROM phone_tags WHERE tag = ?)')
+            params.append(tag)
+
+    for spec in args.getlist('spec'):
+        for key, value in parse_specifications(spec):
+            if value:
+                clauses.append('p.id IN (SELECT phone_id FROM phone_specs WHERE spec_key = ? AND spec_value = ?)')
+                params.extend([key, value])
+            else:
+                clauses.append('p.id IN (SELECT phone_id FROM phone_specs WHERE spec_key = ?)')
+                params.append(key)
+
+    where = ''.join(f' AND {clause}' for clause in clauses)
+    return where, params
+
+# Authentication
+USER_CACHE_TTL = 300  # seconds a cached user lookup stays valid
+
+_user_cache = {}
+_user_cache_lock = threading.Lock()
+
+def is_password_hash(password):
+    """Check whether a stored password is a werkzeug hash rather than plaintext"""
+    return bool(password) and password.split(':', 1)[0] in ('pbkdf2', 'scrypt')
+
+def get_user(user_id):
+    """Return {'id', 'username'} for a user, or None if it does not exist.
+
+    Found users are cached in-process for USER_CACHE_TTL seconds so that the
+    auth check on each request does not touch the database. Missing users
+    are not cached.
+    """
+    now = time.monotonic()
+    cached = _user_cache.get(user_id)
+    if cached is not None and cached[0] > now:
+        return cached[1]
+    
+    conn = sqlite3.connect('phones.db')
+    c = conn.cursor()
+    c.execute('SELECT id, username FROM users WHERE id = ?', (user_id,))
+    row = c.fetchone()
+    conn.close()
+    
+    if row is None:
+        return None
+    
+    user = {'id': row[0], 'username': row[1]}
+    with _user_cache_lock:
+        _user_cache[user_id] = (now + USER_CACHE_TTL, user)
+    return user
+
+def invalidate_user(user_id=None):
+    """Drop one user (or every user) from the lookup cache"""
+    with _user_cache_lock:
+        if user_id is None:
+            _user_cache.clear()
+        else:
+            _user_cache.pop(user_id, None)
+
+def current_user():
+    """Resolve the logged-in user for this request, or None"""
+    user_id = session.get('user_id')
+    if user_id is None:
+        return None
+    return get_user(user_id)
+
+def login_required(view):
+    """Redirect page requests without a valid session to the login page"""
+    @wraps(view)
+    def wrapped(*args, **kwargs):
+        if current_user() is None:
+            return redirect(url_for('main.login'))
+        return view(*args, **kwargs)
+    return wrapped
+
+def api_auth_required(view):
+    """Reject API requests without a valid session with a 401 JSON error"""
+    @wraps(view)
+    def wrapped(*args, **kwargs):
+        if current_user() is None:
+            return jsonify({'error': 'Authentication required'}), 401
+        return view(*args, **kwargs)
+    return wrapped
+
+@bp.route('/')
+@login_required
 def index():
-    if 'user_id' not in session:
-        return redirect(url_for('login'))
     return render_template('index.html')
 
-@app.route('/login', methods=['GET', 'POST'])
+@bp.route('/login', methods=['GET', 'POST'])
 def login():
     if request.method == 'POST':
         username = request.form['username']
@@ -156,43 +452,51 @@ def login():
         
         conn = sqlite3.connect('phones.db')
         c = conn.cursor()
-        c.execute('SELECT id, username FROM users WHERE username = ? AND password = ?', 
-                 (username, password))
+        c.execute('SELECT id, username, password FROM users WHERE username = ?', (username,))
         user = c.fetchone()
+        
+        authenticated = False
+        if user and is_password_hash(user[2]):
+            authenticated = check_password_hash(user[2], password)
+        elif user:
+            # Plaintext password from before hashing: verify it, then store the hash
+            authenticated = hmac.compare_digest(user[2].encode(), password.encode())
+            if authenticated:
+                c.execute('UPDATE users SET password = ? WHERE id = ?',
+                          (generate_password_hash(password), user[0]))
+                conn.commit()
         conn.close()
         
-        if user:
+        if authenticated:
+            invalidate_user(user[0])
             session['user_id'] = user[0]
             session['username'] = user[1]
             flash('Login successful!', 'success')
-            return redirect(url_for('index'))
+            return redirect(url_for('main.index'))
         else:
             flash('Invalid credentials!', 'error')
     
     return render_template('login.html')
 
-@app.route('/logout')
+@bp.route('/logout')
 def logout():
     session.clear()
-    return redirect(url_for('login'))
+    return redirect(url_for('main.login'))
 
-@app.route('/inventory')
+@bp.route('/inventory')
+@login_required
 def inventory():
-    if 'user_id' not in session:
-        return redirect(url_for('login'))
     return render_template('inventory.html')
 
-@app.route('/platforms')
+@bp.route('/platforms')
+@login_required
 def platforms():
-    if 'user_id' not in session:
-        return redirect(url_for('login'))
     return render_template('platforms.html')
 
-@app.route('/api/phones', methods=['GET'])
+@bp.route('/api/phones', methods=['GET'])
+@api_auth_required
 def get_phones():
-    search = request.args.get('search', '')
-    condition_filter = request.args.get('condition', '')
-    platform_filter = request.args.get('platform', '')
+    where, params = build_phone_filters(request.args)
     
     conn = sqlite3.connect('phones.db')
     c = conn.cursor()
@@ -203,16 +507,7 @@ def get_phones():
         FROM phones p 
         LEFT JOIN platform_listings pl ON p.id = pl.phone_id 
         WHERE 1=1
-    '''
-    params = []
-    
-    if search:
-        query += ' AND (p.model_name LIKE ? OR p.brand LIKE ?)'
-        params.extend([f'%{search}%', f'%{search}%'])
-    
-    if condition_filter:
-        query += ' AND p.condition = ?'
-        params.append(condition_filter)
+    ''' + where
     
     query += ' GROUP BY p.id ORDER BY p.created_at DESC'
     
@@ -247,7 +542,65 @@ def get_phones():
     
     return jsonify(result)
 
-@app.route('/api/phones', methods=['POST'])
+def count_phone_facets(c, where, params):
+    """Count brand, condition, storage and tag values over the matching phones"""
+    # One pass over the filtered phones, with each phone's tags collapsed
+    # into a single column so every facet is counted from the same row
+    c.execute('''
+        SELECT p.brand, p.condition, p.storage,
+               (SELECT GROUP_CONCAT(t.tag, char(31)) FROM phone_tags t WHERE t.phone_id = p.id) as tag_list
+        FROM phones p
+        WHERE 1=1
+    ''' + where, params)
+    
+    facets = {'brand': {}, 'condition': {}, 'storage': {}, 'tag': {}}
+    total = 0
+    for brand, condition, storage, tag_list in c:
+        total += 1
+        for facet, value in (('brand', brand), ('condition', condition), ('storage', storage)):
+            if value:
+                facets[facet][value] = facets[facet].get(value, 0) + 1
+        if tag_list:
+            for tag in tag_list.split('\x1f'):
+                facets['tag'][tag] = facets['tag'].get(tag, 0) + 1
+    
+    return total, facets
+
+@bp.route('/api/phones/facets')
+@api_auth_required
+def phone_facets():
+    """Brand, condition, storage and tag counts for the inventory filter UI.
+
+    Each facet is counted with every active filter except its own, so a
+    select still lists the alternatives to its current value. Facets without
+    an active filter share one pass over the fully filtered phones; each
+    active facet gets one extra pass without its own filter.
+    """
+    conn = sqlite3.connect('phones.db')
+    c = conn.cursor()
+    
+    total, facets = count_phone_facets(c, *build_phone_filters(request.args))
+    
+    for facet in facets:
+        if any(value.strip() for value in request.args.getlist(facet)):
+            _, unfiltered = count_phone_facets(c, *build_phone_filters(request.args, exclude=facet))
+            facets[facet] = unfiltered[facet]
+    
+    conn.close()
+    
+    return jsonify({
+        'total': total,
+        'facets': {
+            facet: sorted(
+                [{'value': value, 'count': count} for value, count in counts.items()],
+                key=lambda item: (-item['count'], item['value'])
+            )
+            for facet, counts in facets.items()
+        }
+    })
+
+@bp.route('/api/phones', methods=['POST'])
+@api_auth_required
 def add_phone():
     data = request.json
     
@@ -278,6 +631,7 @@ def add_phone():
         ))
         
         phone_id = c.lastrowid
+        sync_phone_attributes(c, phone_id, data.get('tags', ''), data.get('specifications', ''))
         
         # Create platform listing entries
         for platform in PLATFORMS.keys():
@@ -299,7 +653,8 @@ def add_phone():
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
-@app.route('/api/phones/<int:phone_id>', methods=['PUT'])
+@bp.route('/api/phones/<int:phone_id>', methods=['PUT'])
+@api_auth_required
 def update_phone(phone_id):
     data = request.json
     
@@ -325,6 +680,8 @@ def update_phone(phone_id):
             phone_id
         ))
         
+        sync_phone_attributes(c, phone_id, data.get('tags', ''), data.get('specifications', ''))
+        
         # Update platform prices
         for platform in PLATFORMS.keys():
             c.execute('''
@@ -346,13 +703,16 @@ def update_phone(phone_id):
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
-@app.route('/api/phones/<int:phone_id>', methods=['DELETE'])
+@bp.route('/api/phones/<int:phone_id>', methods=['DELETE'])
+@api_auth_required
 def delete_phone(phone_id):
     try:
         conn = sqlite3.connect('phones.db')
         c = conn.cursor()
         
         c.execute('DELETE FROM platform_listings WHERE phone_id = ?', (phone_id,))
+        c.execute('DELETE FROM phone_tags WHERE phone_id = ?', (phone_id,))
+        c.execute('DELETE FROM phone_specs WHERE phone_id = ?', (phone_id,))
         c.execute('DELETE FROM phones WHERE id = ?', (phone_id,))
         
         conn.commit()
@@ -365,7 +725,8 @@ def delete_phone(phone_id):
 
 # Fixed bulk upload endpoint
 # Fixed bulk upload endpoint with better error handling
-@app.route("/api/bulk-upload", methods=["POST"])
+@bp.route("/api/bulk-upload", methods=["POST"])
+@api_auth_required
 def bulk_upload():
     if "file" not in request.files:
         return jsonify({"error": "No file uploaded"}), 400
@@ -396,30 +757,19 @@ def bulk_upload():
                 # Try cp1252 (Windows encoding)
                 csv_string = file_content.decode('cp1252')
         
-        # Use StringIO to create file-like object for pandas
-        from io import StringIO
-        csv_file = StringIO(csv_string)
-        
-        # Read CSV with pandas
-        df = pd.read_csv(csv_file)
-        
-        # Clean column names - remove whitespace
-        df.columns = df.columns.str.strip()
+        columns, rows = read_csv_rows(csv_string)
         
         # Validate required columns
         required_columns = ['model_name', 'brand', 'condition', 'base_price']
-        missing_columns = [col for col in required_columns if col not in df.columns]
+        missing_columns = [col for col in required_columns if col not in columns]
         
         if missing_columns:
             return jsonify({
                 "error": f"Missing required columns: {', '.join(missing_columns)}. "
-                        f"Found columns: {', '.join(df.columns.tolist())}"
+                        f"Found columns: {', '.join(columns)}"
             }), 400
         
-        # Remove completely empty rows
-        df = df.dropna(how='all')
-        
-        if df.empty:
+        if not rows:
             return jsonify({"error": "CSV file is empty or contains no valid data"}), 400
         
     except Exception as e:
@@ -432,13 +782,12 @@ def bulk_upload():
     success_count, error_count = 0, 0
     errors = []
 
-    for index, row in df.iterrows():
-        row_num = index + 2  # +2 because pandas is 0-indexed and we skip header
+    for row_num, row in rows:
         try:
             # Validate required fields
-            model_name = str(row.get("model_name", "")).strip()
-            brand = str(row.get("brand", "")).strip()
-            condition = str(row.get("condition", "")).strip()
+            model_name = str(row.get("model_name") or "").strip()
+            brand = str(row.get("brand") or "").strip()
+            condition = str(row.get("condition") or "").strip()
             base_price = row.get("base_price")
             
             # Check for missing required fields
@@ -465,14 +814,14 @@ def bulk_upload():
                 continue
             
             # Get optional fields with defaults
-            storage = str(row.get("storage", "")).strip() if pd.notna(row.get("storage")) else ""
-            color = str(row.get("color", "")).strip() if pd.notna(row.get("color")) else ""
-            specifications = str(row.get("specifications", "")).strip() if pd.notna(row.get("specifications")) else ""
-            tags = str(row.get("tags", "")).strip() if pd.notna(row.get("tags")) else ""
+            storage = str(row.get("storage") or "").strip()
+            color = str(row.get("color") or "").strip()
+            specifications = str(row.get("specifications") or "").strip()
+            tags = str(row.get("tags") or "").strip()
             
             # Handle stock_quantity
             try:
-                stock_quantity = int(row.get("stock_quantity", 0) or 0)
+                stock_quantity = int(float(row.get("stock_quantity") or 0))
                 if stock_quantity < 0:
                     stock_quantity = 0
             except (ValueError, TypeError):
@@ -496,6 +845,7 @@ def bulk_upload():
             ))
 
             phone_id = c.lastrowid
+            sync_phone_attributes(c, phone_id, tags, specifications)
 
             # Create platform listings for each platform
             for platform in PLATFORMS.keys():
@@ -548,7 +898,8 @@ def bulk_upload():
         "errors": errors[:10] if errors else []  # Show first 10 errors
     }), 200
     
-@app.route('/api/platform-summary')
+@bp.route('/api/platform-summary')
+@api_auth_required
 def platform_summary():
     conn = sqlite3.connect('phones.db')
     c = conn.cursor()
@@ -578,7 +929,8 @@ def platform_summary():
     return jsonify(summary)
 
 # New endpoints for platform management
-@app.route('/api/platforms/<platform>/bulk-list', methods=['POST'])
+@bp.route('/api/platforms/<platform>/bulk-list', methods=['POST'])
+@api_auth_required
 def bulk_list_platform(platform):
     if platform not in PLATFORMS:
         return jsonify({'error': 'Invalid platform'}), 400
@@ -625,7 +977,8 @@ def bulk_list_platform(platform):
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
-@app.route('/api/platforms/<platform>/update-prices', methods=['POST'])
+@bp.route('/api/platforms/<platform>/update-prices', methods=['POST'])
+@api_auth_required
 def update_platform_prices(platform):
     if platform not in PLATFORMS:
         return jsonify({'error': 'Invalid platform'}), 400
@@ -667,7 +1020,8 @@ def update_platform_prices(platform):
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
-@app.route('/api/analysis/profitability')
+@bp.route('/api/analysis/profitability')
+@api_auth_required
 def profitability_analysis():
     try:
         conn = sqlite3.connect('phones.db')
@@ -720,5 +1074,4 @@ def profitability_analysis():
         return jsonify({'error': str(e)}), 500
 
 if __name__ == '__main__':
-    init_db()
-    app.run(debug=True)
\ No newline at end of file
+    create_app().run(debug=True)
\ No newline at end of file
@@ -0,0 +1,90 @@
+"""Measure the per-request cost of the API auth check.
+
+Runs against a throwaway database in a temporary directory: wraps a no-op
+view with api_auth_required, calls it with a logged-in session and reports
+the overhead per call and how many SQL statements the check issued once the
+user lookup is cached (expected: 0). Run from the project directory:
+
+    python benchmarks/bench_auth.py --calls 100000
+"""
+import argparse
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_DIR)
+
+import app as phone_app  # noqa: E402
+
+
+def count_statements(counter):
+    """Patch sqlite3.connect so every statement executed increments counter"""
+    original_connect = sqlite3.connect
+
+    def connect(*args, **kwargs):
+        conn = original_connect(*args, **kwargs)
+        conn.set_trace_callback(lambda statement: counter.append(statement))
+        return conn
+
+    sqlite3.connect = connect
+    return original_connect
+
+
+def time_calls(view, calls):
+    start = time.perf_counter()
+    for _ in range(calls):
+        view()
+    return (time.perf_counter() - start) / calls * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--calls', type=int, default=100000, help='number of calls to time')
+    args = parser.parse_args()
+
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as workdir:
+        os.chdir(workdir)
+        try:
+            app = phone_app.create_app({'UPLOAD_FOLDER': os.path.join(workdir, 'uploads')})
+
+            def noop():
+                return 'ok'
+
+            protected = phone_app.api_auth_required(noop)
+
+            with app.test_request_context('/api/phones'):
+                phone_app.session['user_id'] = 1
+                phone_app.invalidate_user()
+
+                statements = []
+                original_connect = count_statements(statements)
+                try:
+                    protected()  # cold: populates the user cache
+                    cold_statements = len(statements)
+                    statements.clear()
+
+                    baseline_us = time_calls(noop, args.calls)
+                    protected_us = time_calls(protected, args.calls)
+                    hot_statements = len(statements)
+                finally:
+                    sqlite3.connect = original_connect
+        finally:
+            os.chdir(cwd)
+
+    print(f'{args.calls} calls')
+    print(f'  unprotected view        {baseline_us:8.3f} us/call')
+    print(f'  api_auth_required view  {protected_us:8.3f} us/call')
+    print(f'  auth overhead           {protected_us - baseline_us:8.3f} us/call')
+    print(f'  SQL statements, cold    {cold_statements}')
+    print(f'  SQL statements, hot     {hot_statements}')
+
+    if hot_statements:
+        sys.exit('auth check issued SQL on the hot path')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,74 @@
+"""Measure worker startup cost: import time and baseline RSS.
+
+Each run starts a fresh interpreter, imports app, builds the Flask app with
+create_app() and reports how long that took, the process RSS afterwards,
+and whether pandas was pulled in. Workers run in a temporary directory
+holding a copy of phones.db, so create_app()'s schema step never touches
+the real database. One untimed worker runs first to apply the one-off
+migrations, so the timed runs measure a steady-state boot. Run from the
+project directory:
+
+    python benchmarks/bench_startup.py --runs 10
+"""
+import argparse
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+WORKER_SCRIPT = '''
+import json, resource, sys, time
+start = time.perf_counter()
+import app
+imported = time.perf_counter()
+app.create_app()
+booted = time.perf_counter()
+rss_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+if sys.platform == 'darwin':
+    rss_kb //= 1024
+print(json.dumps({
+    'import_ms': (imported - start) * 1000,
+    'boot_ms': (booted - start) * 1000,
+    'rss_mb': rss_kb / 1024,
+    'pandas_loaded': 'pandas' in sys.modules,
+}))
+'''
+
+
+def run_worker(workdir):
+    """Start one fresh interpreter and return its startup measurements"""
+    env = dict(os.environ, PYTHONPATH=PROJECT_DIR)
+    output = subprocess.check_output(
+        [sys.executable, '-c', WORKER_SCRIPT],
+        cwd=workdir,
+        env=env,
+    )
+    return json.loads(output)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--runs', type=int, default=5, help='number of fresh worker processes')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        shutil.copy(os.path.join(PROJECT_DIR, 'phones.db'), workdir)
+        run_worker(workdir)  # applies pending migrations to the copy
+        results = [run_worker(workdir) for _ in range(args.runs)]
+
+    print(f'{args.runs} worker starts')
+    for key, label in (('import_ms', 'import app'), ('boot_ms', 'create_app'), ('rss_mb', 'max RSS')):
+        values = [result[key] for result in results]
+        unit = 'MB' if key == 'rss_mb' else 'ms'
+        print(f'  {label:<12} median {statistics.median(values):8.1f} {unit}'
+              f'   min {min(values):8.1f} {unit}   max {max(values):8.1f} {unit}')
+    print(f"  pandas imported at startup: {any(result['pandas_loaded'] for result in results)}")
+
+
+if __name__ == '__main__':
+    main()
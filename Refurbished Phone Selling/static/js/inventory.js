@@ -75,20 +75,12 @@ async function uploadBulkFile() {
     try {
         console.log("Starting bulk upload...");
         
-        const response = await fetch("/api/bulk-upload", {
+        const data = await Utils.apiRequest("/api/bulk-upload", {
             method: "POST",
             body: formData
         });
-
-        console.log("Response status:", response.status);
-        
-        const data = await response.json();
         console.log("Response data:", data);
 
-        if (!response.ok) {
-            throw new Error(data.error || `HTTP ${response.status}`);
-        }
-
         // Success
         if (data.success) {
             alert(`✅ ${data.message}`);
@@ -167,15 +159,10 @@ async function loadPhones() {
     
     try {
         console.log("Loading phones...");
-        const response = await fetch("/api/phones");
-        
-        if (!response.ok) {
-            throw new Error(`HTTP ${response.status}`);
-        }
-        
-        phones = await response.json();
+        phones = await Utils.apiRequest(`/api/phones?${buildFilterParams()}`);
         console.log("Loaded phones:", phones.length);
-        renderPhones(phones);
+        renderPhones(applySearch(phones));
+        loadFacets();
         
     } catch (error) {
         console.error("Error loading phones:", error);
@@ -259,14 +246,8 @@ async function deletePhone(id) {
     if (!confirm("Are you sure you want to delete this phone?")) return;
     
     try {
-        const response = await fetch(`/api/phones/${id}`, { method: "DELETE" });
-        
-        if (response.ok) {
-            await loadPhones();
-        } else {
-            const error = await response.json();
-            alert("Failed to delete phone: " + (error.error || "Unknown error"));
-        }
+        await Utils.apiRequest(`/api/phones/${id}`, { method: "DELETE" });
+        await loadPhones();
     } catch (error) {
         console.error("Delete failed:", error);
         alert("Failed to delete phone: " + error.message);
@@ -298,28 +279,20 @@ document.addEventListener("DOMContentLoaded", () => {
             };
 
             try {
-                let response;
                 if (editingPhoneId) {
-                    response = await fetch(`/api/phones/${editingPhoneId}`, {
+                    await Utils.apiRequest(`/api/phones/${editingPhoneId}`, {
                         method: "PUT",
-                        headers: { "Content-Type": "application/json" },
                         body: JSON.stringify(payload)
                     });
                 } else {
-                    response = await fetch("/api/phones", {
+                    await Utils.apiRequest("/api/phones", {
                         method: "POST",
-                        headers: { "Content-Type": "application/json" },
                         body: JSON.stringify(payload)
                     });
                 }
 
-                if (response.ok) {
-                    await loadPhones();
-                    closeModal();
-                } else {
-                    const error = await response.json();
-                    alert("Error: " + (error.error || "Failed to save phone"));
-                }
+                await loadPhones();
+                closeModal();
             } catch (error) {
                 console.error("Save failed:", error);
                 alert("Failed to save phone: " + error.message);
@@ -332,16 +305,75 @@ document.addEventListener("DOMContentLoaded", () => {
 });
 
 // ========== SEARCH & FILTER ==========
+// Filter selects, keyed by the /api/phones parameter and facet they use
+const FACET_FILTERS = {
+    brand: { id: "brand-filter", label: "All Brands" },
+    condition: { id: "condition-filter", label: "All Conditions" },
+    storage: { id: "storage-filter", label: "All Storage" },
+    tag: { id: "tag-filter", label: "All Tags" },
+};
+
+function buildFilterParams() {
+    const params = new URLSearchParams();
+
+    Object.entries(FACET_FILTERS).forEach(([param, { id }]) => {
+        const select = document.getElementById(id);
+        if (select && select.value) params.append(param, select.value);
+    });
+
+    return params.toString();
+}
+
+// Apply the search box text to a loaded phone list
+function applySearch(list) {
+    const searchInput = document.getElementById("search-input");
+    const query = searchInput ? searchInput.value.toLowerCase() : "";
+    if (!query) return list;
+
+    return list.filter(phone =>
+        phone.model_name.toLowerCase().includes(query) ||
+        phone.brand.toLowerCase().includes(query)
+    );
+}
+
+function fillFacetSelect(select, label, items) {
+    const selected = select.value;
+
+    select.innerHTML = "";
+    select.appendChild(new Option(label, ""));
+    items.forEach(({ value, count }) => {
+        select.appendChild(new Option(`${value} (${count})`, value));
+    });
+    select.value = selected;
+}
+
+async function loadFacets() {
+    try {
+        const data = await Utils.apiRequest(`/api/phones/facets?${buildFilterParams()}`);
+
+        Object.entries(FACET_FILTERS).forEach(([facet, { id, label }]) => {
+            const select = document.getElementById(id);
+            if (select) fillFacetSelect(select, label, data.facets[facet] || []);
+        });
+    } catch (error) {
+        console.error("Error loading facets:", error);
+    }
+}
+
+document.addEventListener("DOMContentLoaded", () => {
+    Object.values(FACET_FILTERS).forEach(({ id }) => {
+        const select = document.getElementById(id);
+        if (select) {
+            select.addEventListener("change", () => loadPhones());
+        }
+    });
+});
+
 document.addEventListener("DOMContentLoaded", () => {
     const searchInput = document.getElementById("search-input");
     if (searchInput) {
-        searchInput.addEventListener("input", (e) => {
-            const query = e.target.value.toLowerCase();
-            const filtered = phones.filter(phone =>
-                phone.model_name.toLowerCase().includes(query) ||
-                phone.brand.toLowerCase().includes(query)
-            );
-            renderPhones(filtered);
+        searchInput.addEventListener("input", () => {
+            renderPhones(applySearch(phones));
         });
     }
 });
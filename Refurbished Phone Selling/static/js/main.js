@@ -11,10 +11,22 @@ const Utils = {
             },
         };
         
+        // Let the browser set the multipart headers for file uploads
+        if (options.body instanceof FormData) {
+            delete defaultOptions.headers;
+        }
+        
         const mergedOptions = { ...defaultOptions, ...options };
         
         try {
             const response = await fetch(url, mergedOptions);
+            
+            // Session missing or expired: send the user back to log in
+            if (response.status === 401) {
+                window.location.href = '/login';
+                throw new Error('Authentication required');
+            }
+            
             const data = await response.json();
             
             if (!response.ok) {